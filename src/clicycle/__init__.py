@@ -8,18 +8,20 @@ from pathlib import Path
 from types import ModuleType
 from typing import TYPE_CHECKING, Any
 
-from clicycle.clicycle import Clicycle
-from clicycle.components.spinner import Spinner
-from clicycle.theme import (
-    ComponentIndentation,
-    ComponentSpacing,
-    Icons,
-    Layout,
-    Theme,
-    Typography,
-)
-
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from clicycle.clicycle import Clicycle
+    from clicycle.components.spinner import Spinner
+    from clicycle.theme import (
+        ComponentIndentation,
+        ComponentSpacing,
+        Icons,
+        Layout,
+        Theme,
+        Typography,
+    )
+
     # Type annotations for dynamically created convenience functions
     def info(message: str) -> None: ...
     def warning(message: str) -> None: ...
@@ -29,7 +31,7 @@ if TYPE_CHECKING:
     def list_item(message: str) -> None: ...
     def section(title: str) -> None: ...
     def table(
-        data: list[dict[str, Any]],
+        data: list[dict[str, Any]] | dict[str, Sequence[Any]],
         title: str | None = None,
         **kwargs: Any,
     ) -> None: ...
@@ -67,6 +69,7 @@ __version__ = "3.1.6"
 # Core exports
 __all__ = [
     "Clicycle",
+    "Spinner",
     "Theme",
     "Icons",
     "Typography",
@@ -75,15 +78,26 @@ __all__ = [
     "ComponentIndentation",
 ]
 
+# Public names resolved on first access so that `import clicycle` doesn't
+# drag in Rich; the heavy imports happen when a symbol is actually used.
+_LAZY_IMPORTS = {
+    "Clicycle": ("clicycle.clicycle", "Clicycle"),
+    "Spinner": ("clicycle.components.spinner", "Spinner"),
+    "Theme": ("clicycle.theme", "Theme"),
+    "Icons": ("clicycle.theme", "Icons"),
+    "Typography": ("clicycle.theme", "Typography"),
+    "Layout": ("clicycle.theme", "Layout"),
+    "ComponentSpacing": ("clicycle.theme", "ComponentSpacing"),
+    "ComponentIndentation": ("clicycle.theme", "ComponentIndentation"),
+}
+
 
 class _ModuleInterface(ModuleType):
     """Module wrapper that provides convenience API."""
 
     def __init__(self, module: ModuleType) -> None:
         self.__dict__.update(module.__dict__)
-        self._cli = Clicycle()
         self._component_cache: dict[str, tuple[str, str]] = {}
-        self._discover_components()
 
     def _discover_components(self) -> None:
         """Discover all components in the components directory."""
@@ -110,6 +124,7 @@ class _ModuleInterface(ModuleType):
         # Dispatch to handlers
         for handler in [
             self._handle_special_attribute,
+            self._handle_lazy_import,
             self._handle_cached_component,
             self._handle_special_function,
         ]:
@@ -123,6 +138,12 @@ class _ModuleInterface(ModuleType):
 
     def _handle_special_attribute(self, name: str, sentinel: object) -> Any:
         """Handle special attributes like 'console', 'theme', etc."""
+        if name == "_cli":
+            # Created on first use so `import clicycle` stays cheap
+            from clicycle.clicycle import Clicycle
+
+            self._cli = Clicycle()
+            return self._cli
         if name == "console":
             return self._cli.console
         if name == "theme":
@@ -130,6 +151,8 @@ class _ModuleInterface(ModuleType):
         if name == "configure":
 
             def configure(**kwargs: Any) -> None:
+                from clicycle.clicycle import Clicycle
+
                 self._cli = Clicycle(**kwargs)
 
             return configure
@@ -137,8 +160,24 @@ class _ModuleInterface(ModuleType):
             return self._cli.clear
         return sentinel
 
+    def _handle_lazy_import(self, name: str, sentinel: object) -> Any:
+        """Resolve public classes deferred by the lazy-import table."""
+        target = _LAZY_IMPORTS.get(name)
+        if target is None:
+            return sentinel
+
+        module_name, class_name = target
+        module = __import__(module_name, fromlist=[class_name])
+        value = getattr(module, class_name)
+        setattr(self, name, value)
+        return value
+
     def _handle_cached_component(self, name: str, sentinel: object) -> Any:
         """Handle components that are in the cache."""
+        # Discovery imports every component module, so it is deferred until
+        # the first component-style attribute is looked up
+        if not self._component_cache:
+            self._discover_components()
         if name not in self._component_cache:
             return sentinel
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 from rich.console import Console
@@ -12,6 +13,26 @@ from clicycle.rendering.stream import RenderStream
 from clicycle.theme import Theme
 
 
+@lru_cache(maxsize=16)
+def _console_for_width(width: int) -> Console:
+    """Return a shared Console for the given width.
+
+    lru_cache's C implementation is faster than a hand-rolled dict lookup
+    and bounds how many Console instances can accumulate.
+    """
+    return Console(width=width)
+
+
+@lru_cache(maxsize=16)
+def _null_console_for_width(width: int) -> Console:
+    """Return a shared Console that discards output, used by group().
+
+    The backing /dev/null handle stays open for the life of the process so
+    repeated group() calls don't pay for a file open and Console build.
+    """
+    return Console(width=width, file=Path("/dev/null").open("w"))
+
+
 class Clicycle:
     """Main orchestrator for component-based CLI rendering.
 
@@ -37,17 +58,13 @@ class Clicycle:
         >>> # Components will use this instance's theme and console
     """
 
-    _console_cache: dict[int, Console] = {}
-
     def __init__(
         self, width: int = 100, theme: Theme | None = None, app_name: str | None = None
     ):
         self.width = width
         self.theme = theme or Theme()
         # Reuse console instances for the same width
-        if width not in Clicycle._console_cache:
-            Clicycle._console_cache[width] = Console(width=width)
-        self.console = Clicycle._console_cache[width]
+        self.console = _console_for_width(width)
         self.stream = RenderStream(self.console)
         self.app_name = app_name
 
@@ -82,25 +99,25 @@ class Clicycle:
         original_stream = self.stream
         original_console = self.console
 
-        with Path("/dev/null").open("w") as dev_null_file:
-            # Create temporary console and stream that won't actually display anything
-            temp_console = Console(width=self.width, file=dev_null_file)
-            temp_stream = RenderStream(temp_console)
+        # Reuse the cached no-op console so each group() call batches its
+        # components without paying for a file open and Console build.
+        temp_console = _null_console_for_width(self.width)
+        temp_stream = RenderStream(temp_console)
 
-            # Temporarily replace both the stream and console
-            self.stream = temp_stream
-            self.console = temp_console
+        # Temporarily replace both the stream and console
+        self.stream = temp_stream
+        self.console = temp_console
 
-            try:
-                yield self
-            finally:
-                # Get all the components that were rendered to the temp stream
-                components = temp_stream.history
+        try:
+            yield self
+        finally:
+            # Get all the components that were rendered to the temp stream
+            components = temp_stream.history
 
-                # Restore original stream and console
-                self.stream = original_stream
-                self.console = original_console
+            # Restore original stream and console
+            self.stream = original_stream
+            self.console = original_console
 
-                # Render as group
-                if components:
-                    self.stream.render(Group(self.theme, components))
+            # Render as group
+            if components:
+                self.stream.render(Group(self.theme, components))
@@ -2,22 +2,32 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
+
 from rich.console import Console
 from rich.table import Table as RichTable
 
 from clicycle.components.base import Component
 from clicycle.theme import Theme
 
+CellValue = str | int | float | bool | None
+
 
 class Table(Component):
-    """Table component - displays data in tabular format."""
+    """Table component - displays data in tabular format.
+
+    Data may be row-oriented (a list of dicts, one per row) or
+    column-oriented (a dict mapping column name to a sequence of values).
+    The columnar form avoids allocating a dict per row and is zipped on
+    demand while rendering, which matters for large tables.
+    """
 
     component_type = "table"
 
     def __init__(
         self,
         theme: Theme,
-        data: list[dict[str, str | int | float | bool | None]],
+        data: list[dict[str, CellValue]] | dict[str, Sequence[CellValue]],
         title: str | None = None,
         column_widths: dict[str, int] | None = None,
         wrap_text: bool = True,
@@ -33,6 +43,16 @@ class Table(Component):
         if not self.data:
             return
 
+        rows: Iterable[Sequence[CellValue]]
+        if isinstance(self.data, dict):
+            # Columnar data: zip the columns lazily instead of building rows;
+            # strict=True turns ragged columns into a clear error
+            columns = list(self.data)
+            rows = zip(*self.data.values(), strict=True)
+        else:
+            columns = list(self.data[0])
+            rows = ([row.get(key, "") for key in columns] for row in self.data)
+
         table = RichTable(
             title=self.title,
             box=self.theme.layout.table_box,
@@ -42,7 +62,7 @@ class Table(Component):
         )
 
         # Add columns with optional width and configurable wrapping
-        for key in self.data[0]:
+        for key in columns:
             column_name = str(key)
             width = self.column_widths.get(column_name)
             table.add_column(
@@ -53,7 +73,7 @@ class Table(Component):
             )
 
         # Add rows
-        for row in self.data:
-            table.add_row(*[str(row.get(key, "")) for key in self.data[0]])
+        for row in rows:
+            table.add_row(*[str(value) for value in row])
 
         console.print(table)
@@ -7,6 +7,17 @@ from rich.console import Console
 from clicycle.components.base import Component
 from clicycle.theme import Theme
 
+# Per text type: the precomputed icon-prefix attribute on Theme and the
+# style attribute on Typography, so render() builds no dicts per call.
+_TEXT_STYLES = {
+    "info": ("_info_icon", "info_style"),
+    "success": ("_success_icon", "success_style"),
+    "error": ("_error_icon", "error_style"),
+    "warning": ("_warning_icon", "warning_style"),
+    "debug": ("_debug_icon", "debug_style"),
+    "list_item": ("_bullet_icon", "info_style"),
+}
+
 
 class Text(Component):
     """Base text component with automatic spacing and theming.
@@ -45,34 +56,18 @@ class Text(Component):
         Args:
             console: Rich console instance for rendering
         """
-        icon_map = {
-            "info": self.theme.icons.info,
-            "success": self.theme.icons.success,
-            "error": self.theme.icons.error,
-            "warning": self.theme.icons.warning,
-            "debug": self.theme.icons.debug,
-        }
-
-        style_map = {
-            "info": self.theme.typography.info_style,
-            "success": self.theme.typography.success_style,
-            "error": self.theme.typography.error_style,
-            "warning": self.theme.typography.warning_style,
-            "debug": self.theme.typography.debug_style,
-        }
-
-        if self.text_type == "list_item":
-            icon = self.theme.icons.bullet
-            style = self.theme.typography.info_style
-        else:
-            icon = icon_map.get(self.text_type, self.theme.icons.info)
-            style = style_map.get(self.text_type, self.theme.typography.info_style)
+        icon_attr, style_attr = _TEXT_STYLES.get(self.text_type, _TEXT_STYLES["info"])
+        prefix: str = getattr(self.theme, icon_attr)
+        style: str = getattr(self.theme.typography, style_attr)
 
         # Get indentation for this text type
         indent_spaces = getattr(self.theme.indentation, self.text_type, 0)
-        indent = " " * indent_spaces
+        if indent_spaces:
+            prefix = f"{' ' * indent_spaces}{prefix}"
 
-        console.print(f"{indent}{icon} {self.message}", style=style)
+        # sep="" lets Rich join prefix and message without an intermediate
+        # concatenated string per message
+        console.print(prefix, self.message, sep="", style=style)
 
 
 class Info(Text):
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import select
 import sys
 import termios
 import tty
@@ -25,6 +27,8 @@ class _BaseRenderer(ABC):
         self.selected_value: Any = None
         self.cursor_line = 0
         self.total_lines = 0
+        # Trailing bytes of an escape sequence split across read boundaries
+        self._key_tail = b""
 
     def _normalize_options(
         self, options: list[str | dict[str, Any]]
@@ -35,6 +39,95 @@ class _BaseRenderer(ABC):
             for opt in options
         ]
 
+    @staticmethod
+    def _parse_key_bytes(data: bytes) -> tuple[list[str], bytes]:
+        """Translate raw terminal bytes into the key names _get_key uses.
+
+        Returns the decoded keys plus any incomplete trailing escape
+        sequence (a lone ESC or ESC-[), which the caller must prepend to
+        the next read so keys straddling a read boundary aren't lost.
+        """
+        keys: list[str] = []
+        i = 0
+        length = len(data)
+        while i < length:
+            byte = data[i]
+            if byte == 0x1B:  # ESC sequence, possibly cut off by the read
+                if i + 1 >= length or (data[i + 1 : i + 2] == b"[" and i + 2 >= length):
+                    break
+                if data[i + 1 : i + 2] != b"[":
+                    i += 2
+                    continue
+                final = data[i + 2 : i + 3]
+                if final == b"A":
+                    keys.append("up")
+                elif final == b"B":
+                    keys.append("down")
+                i += 3
+                continue
+            if byte in (0x0D, 0x0A):
+                keys.append("enter")
+            elif byte == 0x20:
+                keys.append("space")
+            elif byte in (0x03, ord("q")):
+                keys.append("quit")
+            i += 1
+        return keys, data[i:]
+
+    def _decode_key_bytes(self, data: bytes) -> list[str]:
+        """Decode a chunk of raw input, carrying split sequences over."""
+        keys, self._key_tail = self._parse_key_bytes(self._key_tail + data)
+        return keys
+
+    def _drain_pending_keys(self) -> list[str]:
+        """Consume keys already queued in the TTY buffer without blocking.
+
+        While a frame is being drawn, a held arrow key can queue several
+        keystrokes; draining them lets the caller fold the whole burst into
+        a single redraw. Only applies to a real terminal - redirected or
+        mocked stdin keeps the one-key-per-read behaviour.
+        """
+        try:
+            fd = sys.stdin.fileno()
+            if not os.isatty(fd):
+                return []
+        except (OSError, ValueError):
+            return []
+
+        keys: list[str] = []
+        while select.select([fd], [], [], 0)[0]:
+            data = os.read(fd, 16)
+            if not data:
+                break
+            keys.extend(self._decode_key_bytes(data))
+        return keys
+
+    def _read_keys(self) -> list[str]:
+        """Block until input arrives and return every decoded key.
+
+        On a real terminal this sleeps in select(2) until the kernel has
+        bytes for us, then consumes the whole queued burst with a single
+        os.read - one syscall and one wakeup per input event instead of one
+        read per byte. Redirected or mocked stdin falls back to the
+        character-wise _get_key reader.
+        """
+        try:
+            fd = sys.stdin.fileno()
+            is_tty = os.isatty(fd)
+        except (OSError, ValueError):
+            is_tty = False
+        if not is_tty:
+            return [self._get_key()]
+
+        keys: list[str] = []
+        while not keys:
+            select.select([fd], [], [])
+            data = os.read(fd, 16)
+            if not data:  # EOF - treat like the user bailing out
+                return ["quit"]
+            keys = self._decode_key_bytes(data)
+        return keys
+
     def _get_key(self) -> str:
         """Read a single keypress, handling arrow keys."""
         key = sys.stdin.read(1)
@@ -61,16 +154,19 @@ class _BaseRenderer(ABC):
 
     def _teardown_terminal(self, fd: int, old_settings: Any) -> None:
         """Restore terminal to its original state."""
+        # Assemble the whole cleanup sequence and emit it with one write
+        # instead of one per cleared line.
+        parts: list[str] = []
         if self.cursor_line > 0:
-            sys.stdout.write(f"\033[{self.cursor_line}A")
+            parts.append(f"\033[{self.cursor_line}A")
 
-        for _ in range(self.total_lines):
-            sys.stdout.write("\033[2K\033[B")
+        parts.append("\033[2K\033[B" * self.total_lines)
 
         if self.title:
-            sys.stdout.write("\033[A\033[2K")
+            parts.append("\033[A\033[2K")
 
-        sys.stdout.write(f"\033[{self.total_lines + bool(self.title)}A\r")
+        parts.append(f"\033[{self.total_lines + bool(self.title)}A\r")
+        sys.stdout.write("".join(parts))
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
         self.cli.console.show_cursor(True)
 
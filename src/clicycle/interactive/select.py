@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from typing import TYPE_CHECKING, Any
 
@@ -10,6 +11,29 @@ from clicycle.interactive.base import _BaseRenderer
 if TYPE_CHECKING:
     from clicycle import Clicycle
 
+# Constant escape-code fragments, built once instead of per frame.
+_CLEAR_LINE = "\r\033[2K"
+_HILITE_PREFIX = "\033[32;1m→ "
+_NORMAL_PREFIX = "  "
+_RESET = "\033[0m"
+
+# Parameter-less single-step moves for the adjacent-row fast path.
+_UP_ONE = "\033[A"
+_DOWN_ONE = "\033[B"
+
+# Precomputed cursor-move sequences for typical menu sizes, so the redraw
+# path never formats small integers into escape codes.
+_MOVE_UP = tuple(f"\033[{i}A" for i in range(64))
+_MOVE_DOWN = tuple(f"\033[{i}B" for i in range(64))
+
+
+def _move_up(rows: int) -> str:
+    return _MOVE_UP[rows] if rows < 64 else f"\033[{rows}A"
+
+
+def _move_down(rows: int) -> str:
+    return _MOVE_DOWN[rows] if rows < 64 else f"\033[{rows}B"
+
 
 class _SelectRenderer(_BaseRenderer):
     """Renders the interactive select prompt."""
@@ -25,6 +49,47 @@ class _SelectRenderer(_BaseRenderer):
         self.current_index = default_index
         self.option_lines: list[int] = []
         self.total_lines = len(self.options)
+        self._stdout_fd: int | None = None
+        # Options and theme are fixed for the renderer's lifetime, so format
+        # every label once instead of on each redraw.
+        self._labels = [self._format_label(opt) for opt in self.options]
+        # Both rendered variants of every row, ready for the initial draw.
+        self._normal_lines = [f"{_NORMAL_PREFIX}{lbl}\n" for lbl in self._labels]
+        self._hilite_lines = [
+            f"{_HILITE_PREFIX}{lbl}{_RESET}\n" for lbl in self._labels
+        ]
+        # Full clear-and-rewrite fragments for the redraw path, so a
+        # keystroke only concatenates cached strings.
+        self._normal_frags = [
+            f"{_CLEAR_LINE}{_NORMAL_PREFIX}{lbl}" for lbl in self._labels
+        ]
+        self._hilite_frags = [
+            f"{_CLEAR_LINE}{_HILITE_PREFIX}{lbl}{_RESET}" for lbl in self._labels
+        ]
+
+    def _write_frame(self, frame: str) -> None:
+        """Write a fully assembled ANSI frame to the terminal.
+
+        On a real terminal the frame is encoded once and emitted with a
+        single write(2) straight to the file descriptor, skipping the
+        TextIOWrapper and BufferedWriter layers entirely. When stdout is
+        redirected (tests, pipes) the plain text path is used.
+        """
+        stdout = sys.stdout
+        if stdout.isatty():
+            fd = self._stdout_fd
+            if fd is None:
+                # Flush buffered text once so raw writes can't overtake it.
+                stdout.flush()
+                fd = self._stdout_fd = stdout.fileno()
+            # write(2) may be partial (full tty queue, signal); loop so a
+            # frame is never truncated mid-escape-sequence
+            data = frame.encode("utf-8")
+            while data:
+                data = data[os.write(fd, data) :]
+        else:
+            stdout.write(frame)
+            stdout.flush()
 
     def _format_label(self, opt: dict[str, Any]) -> str:
         """Format label with special handling for 'Back' and 'Exit'."""
@@ -41,64 +106,92 @@ class _SelectRenderer(_BaseRenderer):
             self.cli.console.print(f"\n{self.title}")
         self.cli.console.show_cursor(False)
 
-        for i, option in enumerate(self.options):
-            label = self._format_label(option)
-            if i == self.current_index:
-                sys.stdout.write(f"\033[32;1m→ {label}\033[0m\n")
-            else:
-                sys.stdout.write(f"  {label}\n")
-        sys.stdout.flush()
+        self._write_frame(
+            "".join(
+                self._hilite_lines[i] if i == self.current_index else line
+                for i, line in enumerate(self._normal_lines)
+            )
+        )
 
         self.cursor_line = len(self.options)
         self.option_lines = list(range(len(self.options)))
 
     def _update_display(self, old_index: int) -> None:
         """Update the display after a selection change."""
+        new_index = self.current_index
+
+        # Fast path: the cursor already sits on the old row and the
+        # selection moved one step, which covers nearly all navigation.
+        if self.cursor_line == self.option_lines[old_index] and (
+            new_index - old_index in (1, -1)
+        ):
+            step = _DOWN_ONE if new_index > old_index else _UP_ONE
+            self.cursor_line = self.option_lines[new_index]
+            self._write_frame(
+                f"{self._normal_frags[old_index]}{step}"
+                f"{self._hilite_frags[new_index]}"
+            )
+            return
+
+        # Build the whole frame in memory and emit it as a single write so
+        # each keypress costs one syscall instead of one per escape sequence.
+        parts: list[str] = []
+
         old_line_pos = self.option_lines[old_index]
         move = self.cursor_line - old_line_pos
         if move > 0:
-            sys.stdout.write(f"\033[{move}A")
+            parts.append(_move_up(move))
 
-        sys.stdout.write("\r\033[2K")
-        label = self._format_label(self.options[old_index])
-        sys.stdout.write(f"  {label}")
+        parts.append(self._normal_frags[old_index])
         self.cursor_line = old_line_pos
 
-        new_line_pos = self.option_lines[self.current_index]
+        new_line_pos = self.option_lines[new_index]
         move = new_line_pos - self.cursor_line
         if move > 0:
-            sys.stdout.write(f"\033[{move}B")
+            parts.append(_move_down(move))
         elif move < 0:
-            sys.stdout.write(f"\033[{-move}A")
+            parts.append(_move_up(-move))
 
-        sys.stdout.write("\r\033[2K")
-        label = self._format_label(self.options[self.current_index])
-        sys.stdout.write(f"\033[32;1m→ {label}\033[0m")
+        parts.append(self._hilite_frags[new_index])
         self.cursor_line = new_line_pos
 
-        sys.stdout.flush()
+        self._write_frame("".join(parts))
 
     def _main_loop(self) -> None:
         """Handle user input and update display."""
+        # Bind the hot lookups once; this loop can fire dozens of times per
+        # second while an arrow key is held down.
+        read_keys = self._read_keys
+        update_display = self._update_display
+        last_index = len(self.options) - 1
+
         while True:
-            key = self._get_key()
+            # Fold the blocking read plus any keys already queued in the TTY
+            # buffer into one pass, so a burst costs a single redraw.
+            keys = read_keys()
+            keys += self._drain_pending_keys()
             old_current = self.current_index
-
-            if key == "up" and self.current_index > 0:
-                self.current_index -= 1
-            elif key == "down" and self.current_index < len(self.options) - 1:
-                self.current_index += 1
-            elif key == "enter":
-                self.selected_value = self.options[self.current_index].get(
-                    "value", self.options[self.current_index].get("label")
-                )
-                break
-            elif key == "quit":
+            done = False
+
+            for key in keys:
+                if key == "up" and self.current_index > 0:
+                    self.current_index -= 1
+                elif key == "down" and self.current_index < last_index:
+                    self.current_index += 1
+                elif key == "enter":
+                    self.selected_value = self.options[self.current_index].get(
+                        "value", self.options[self.current_index].get("label")
+                    )
+                    done = True
+                    break
+                elif key == "quit":
+                    done = True
+                    break
+
+            if done:
                 break
-            else:
-                continue
-
-            self._update_display(old_current)
+            if self.current_index != old_current:
+                update_display(old_current)
 
 
 def interactive_select(
@@ -209,9 +209,6 @@ class Theme:
         "dots"  # Rich spinner types: dots, dots2, dots3, line, bouncingBar, etc.
     )
 
-    # Performance optimization: cached formatted styles
-    _style_cache: dict[str, str] = field(default_factory=dict, init=False, repr=False)
-
     def __post_init__(self) -> None:
         """Validate theme and pre-compute cached styles."""
         # Validate width
@@ -234,17 +231,14 @@ class Theme:
                 f"Invalid spinner type '{self.spinner_type}'. Must be one of: {', '.join(valid_spinners)}"
             )
 
-        # Pre-compute and cache frequently used style combinations
-        self._style_cache.update(
-            {
-                "info_icon": f"{self.icons.info} ",
-                "success_icon": f"{self.icons.success} ",
-                "warning_icon": f"{self.icons.warning} ",
-                "error_icon": f"{self.icons.error} ",
-                "debug_icon": f"{self.icons.debug} ",
-                "bullet_icon": f"{self.icons.bullet} ",
-            }
-        )
+        # Pre-compute frequently used icon prefixes as plain attributes;
+        # LOAD_ATTR is cheaper than a dict probe plus string hash per message
+        self._info_icon = f"{self.icons.info} "
+        self._success_icon = f"{self.icons.success} "
+        self._warning_icon = f"{self.icons.warning} "
+        self._error_icon = f"{self.icons.error} "
+        self._debug_icon = f"{self.icons.debug} "
+        self._bullet_icon = f"{self.icons.bullet} "
 
     def transform_text(self, text: str, transform: str) -> str:
         """Apply text transformation based on theme settings.
@@ -276,6 +276,20 @@ class TestTable:
         call_args = console.print.call_args[0]
         assert isinstance(call_args[0], RichTable)
 
+    def test_table_render_columnar(self):
+        """Test table rendering from column-oriented data."""
+        theme = Theme()
+        console = MagicMock(spec=Console)
+
+        data = {"name": ["Alice", "Bob"], "age": [30, 25]}
+        table = Table(theme, data, title="Users")
+        table.render(console)
+
+        console.print.assert_called()
+        rich_table = console.print.call_args[0][0]
+        assert isinstance(rich_table, RichTable)
+        assert rich_table.row_count == 2
+
     def test_table_empty(self):
         """Test table with no data."""
         theme = Theme()
@@ -91,6 +91,102 @@ class TestBaseRenderer:
             assert key == "quit"
 
 
+class TestKeyByteParsing:
+    """Test raw key-byte decoding shared by the renderers."""
+
+    def _renderer(self):
+        cli = MagicMock()
+        return _SelectRenderer("Title", ["A", "B"], 0, cli)
+
+    def test_parse_arrow_keys(self):
+        """Test decoding arrow key escape sequences."""
+        keys, tail = _SelectRenderer._parse_key_bytes(b"\x1b[A\x1b[B")
+        assert keys == ["up", "down"]
+        assert tail == b""
+
+    def test_parse_control_keys(self):
+        """Test decoding enter, space and quit bytes."""
+        keys, tail = _SelectRenderer._parse_key_bytes(b"\r\n q\x03")
+        assert keys == ["enter", "enter", "space", "quit", "quit"]
+        assert tail == b""
+
+    def test_parse_multi_key_burst(self):
+        """Test decoding a burst of queued keystrokes."""
+        keys, tail = _SelectRenderer._parse_key_bytes(b"\x1b[B" * 4 + b"\r")
+        assert keys == ["down", "down", "down", "down", "enter"]
+        assert tail == b""
+
+    def test_parse_partial_escape_tail(self):
+        """Test that a truncated escape sequence is returned as the tail."""
+        keys, tail = _SelectRenderer._parse_key_bytes(b"\x1b[A\x1b")
+        assert keys == ["up"]
+        assert tail == b"\x1b"
+
+        keys, tail = _SelectRenderer._parse_key_bytes(b"\x1b[A\x1b[")
+        assert keys == ["up"]
+        assert tail == b"\x1b["
+
+    def test_parse_ignores_unknown_sequences(self):
+        """Test that unknown escape sequences decode to no keys."""
+        keys, tail = _SelectRenderer._parse_key_bytes(b"\x1b[C\x1bx")
+        assert keys == []
+        assert tail == b""
+
+    def test_decode_carries_tail_across_chunks(self):
+        """Test that sequences split across reads are not dropped."""
+        renderer = self._renderer()
+
+        # Six up-arrows (18 bytes) read in 16-byte chunks: the sixth
+        # sequence straddles the boundary and must survive the split
+        burst = b"\x1b[A" * 6
+        assert renderer._decode_key_bytes(burst[:16]) == ["up"] * 5
+        assert renderer._decode_key_bytes(burst[16:]) == ["up"]
+        assert renderer._key_tail == b""
+
+    @patch("clicycle.interactive.base.os.read")
+    @patch("clicycle.interactive.base.select.select")
+    @patch("clicycle.interactive.base.os.isatty")
+    @patch("sys.stdin")
+    def test_read_keys_tty_burst(
+        self, mock_stdin, mock_isatty, mock_select, mock_read
+    ):
+        """Test the TTY branch of _read_keys decodes a whole burst."""
+        mock_stdin.fileno.return_value = 0
+        mock_isatty.return_value = True
+        mock_select.return_value = ([0], [], [])
+        mock_read.return_value = b"\x1b[B\x1b[B\r"
+
+        renderer = self._renderer()
+        assert renderer._read_keys() == ["down", "down", "enter"]
+        mock_read.assert_called_once_with(0, 16)
+
+    @patch("clicycle.interactive.base.os.read")
+    @patch("clicycle.interactive.base.select.select")
+    @patch("clicycle.interactive.base.os.isatty")
+    @patch("sys.stdin")
+    def test_drain_pending_keys(
+        self, mock_stdin, mock_isatty, mock_select, mock_read
+    ):
+        """Test draining queued keys until the TTY buffer is empty."""
+        mock_stdin.fileno.return_value = 0
+        mock_isatty.return_value = True
+        mock_select.side_effect = [([0], [], []), ([], [], [])]
+        mock_read.return_value = b"\x1b[A\x1b[A"
+
+        renderer = self._renderer()
+        assert renderer._drain_pending_keys() == ["up", "up"]
+
+    @patch("clicycle.interactive.base.os.isatty")
+    @patch("sys.stdin")
+    def test_drain_pending_keys_non_tty(self, mock_stdin, mock_isatty):
+        """Test that draining is skipped when stdin is not a terminal."""
+        mock_stdin.fileno.return_value = 0
+        mock_isatty.return_value = False
+
+        renderer = self._renderer()
+        assert renderer._drain_pending_keys() == []
+
+
 class TestSelectRenderer:
     """Test the select renderer."""
 
@@ -108,7 +204,8 @@ class TestSelectRenderer:
 
     @patch("sys.stdout.write")
     @patch("sys.stdout.flush")
-    def test_setup_terminal(self, _mock_flush, mock_write):
+    @patch("sys.stdout.isatty", return_value=False)
+    def test_setup_terminal(self, _mock_isatty, _mock_flush, mock_write):
         """Test terminal setup."""
         cli = MagicMock()
         cli.console = MagicMock()
@@ -121,18 +218,25 @@ class TestSelectRenderer:
         cli.console.print.assert_called_with("\nTest Title")
         # Should hide cursor
         cli.console.show_cursor.assert_called_with(False)
-        # Should write options
-        assert mock_write.call_count >= 3  # At least one per option
+        # Should write all options in a single batched write
+        assert mock_write.call_count == 1
+        output = mock_write.call_args[0][0]
+        for label in ("A", "B", "C"):
+            assert label in output
 
     @patch("termios.tcgetattr")
     @patch("termios.tcsetattr")
     @patch("tty.setraw")
     @patch("sys.stdout.write")
     @patch("sys.stdout.flush")
+    @patch("sys.stdout.isatty", return_value=False)
+    @patch("clicycle.interactive.base.os.isatty", return_value=False)
     @patch("sys.stdin")
     def test_render_full_flow(
         self,
         mock_stdin,
+        _mock_os_isatty,
+        _mock_stdout_isatty,
         _mock_flush,
         _mock_write,
         _mock_setraw,
@@ -2,6 +2,7 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
 from rich.console import Console
 
 from clicycle.components.text import Info
@@ -9,6 +10,22 @@ from clicycle.rendering.stream import RenderStream
 from clicycle.theme import Theme
 
 
+@pytest.fixture(scope="module")
+def theme():
+    """Shared read-only theme, built once instead of per test."""
+    return Theme()
+
+
+@pytest.fixture
+def console():
+    return MagicMock(spec=Console)
+
+
+@pytest.fixture
+def stream(console):
+    return RenderStream(console)
+
+
 class TestRenderStream:
     """Test the RenderStream orchestrator."""
 
@@ -22,12 +39,8 @@ class TestRenderStream:
         assert stream.in_live_context is False
         assert stream.deferred_component is None
 
-    def test_render_regular_component(self):
+    def test_render_regular_component(self, console, stream, theme):
         """Test rendering a regular component."""
-        console = MagicMock(spec=Console)
-        stream = RenderStream(console)
-        theme = Theme()
-
         component = Info(theme, "Test message")
 
         with patch.object(component, "render_with_spacing") as mock_render:
@@ -39,12 +52,8 @@ class TestRenderStream:
             # Should be in history
             assert component in stream.history
 
-    def test_render_deferred_component(self):
+    def test_render_deferred_component(self, console, stream):
         """Test rendering a deferred component (progress/spinner)."""
-        console = MagicMock(spec=Console)
-        stream = RenderStream(console)
-        Theme()
-
         # Create a mock progress component with deferred_render attribute
         progress = MagicMock()
         progress.deferred_render = True
@@ -63,12 +72,8 @@ class TestRenderStream:
         assert stream.deferred_component is progress
         assert stream.in_live_context is True
 
-    def test_render_after_deferred_clears_tracking(self):
+    def test_render_after_deferred_clears_tracking(self, stream, theme):
         """Test that rendering after a deferred component clears tracking."""
-        console = MagicMock(spec=Console)
-        stream = RenderStream(console)
-        theme = Theme()
-
         # First render a mock spinner (deferred component)
         spinner = MagicMock()
         spinner.deferred_render = True
@@ -87,12 +92,8 @@ class TestRenderStream:
         assert stream.deferred_component is None
         assert stream.in_live_context is False
 
-    def test_last_component_property(self):
+    def test_last_component_property(self, stream, theme):
         """Test the last_component property."""
-        console = MagicMock(spec=Console)
-        stream = RenderStream(console)
-        theme = Theme()
-
         # Initially should be None
         assert stream.last_component is None
 
@@ -106,12 +107,8 @@ class TestRenderStream:
         stream.render(info2)
         assert stream.last_component is info2
 
-    def test_clear_history(self):
+    def test_clear_history(self, stream, theme):
         """Test clearing render history."""
-        console = MagicMock(spec=Console)
-        stream = RenderStream(console)
-        theme = Theme()
-
         # Add some components to history
         info1 = Info(theme, "First")
         info2 = Info(theme, "Second")
@@ -126,12 +123,8 @@ class TestRenderStream:
         assert stream.history == []
         assert stream.last_component is None
 
-    def test_component_gets_context_from_last(self):
+    def test_component_gets_context_from_last(self, stream, theme):
         """Test that components get context from the last component."""
-        console = MagicMock(spec=Console)
-        stream = RenderStream(console)
-        theme = Theme()
-
         # Render first component
         info1 = Info(theme, "First")
         stream.render(info1)
@@ -145,12 +138,8 @@ class TestRenderStream:
             # Should have been given the first component as context
             mock_set_context.assert_called_once_with(info1)
 
-    def test_deferred_component_gets_context(self):
+    def test_deferred_component_gets_context(self, stream, theme):
         """Test that deferred components get context from last component."""
-        console = MagicMock(spec=Console)
-        stream = RenderStream(console)
-        theme = Theme()
-
         # Render a regular component first
         info = Info(theme, "Info message")
         stream.render(info)
@@ -166,12 +155,8 @@ class TestRenderStream:
         # Should have been given the info component as context
         progress.set_context.assert_called_once_with(info)
 
-    def test_multiple_deferred_components(self):
+    def test_multiple_deferred_components(self, stream):
         """Test rendering multiple deferred components in sequence."""
-        console = MagicMock(spec=Console)
-        stream = RenderStream(console)
-        Theme()
-
         # Render first mock progress bar
         progress1 = MagicMock()
         progress1.deferred_render = True
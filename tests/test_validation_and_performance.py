@@ -6,6 +6,7 @@ import pytest
 from rich.console import Console
 
 from clicycle import Clicycle, Theme
+from clicycle.clicycle import _console_for_width
 from clicycle.components.text import Info, Text
 from clicycle.rendering.stream import RenderStream
 
@@ -72,7 +73,7 @@ class TestConsoleCaching:
     def test_console_reused_same_width(self):
         """Test that console is reused for same width."""
         # Clear cache first
-        Clicycle._console_cache.clear()
+        _console_for_width.cache_clear()
 
         cli1 = Clicycle(width=80)
         cli2 = Clicycle(width=80)
@@ -88,7 +89,7 @@ class TestConsoleCaching:
 
     def test_cache_persists(self):
         """Test that cache persists across instances."""
-        Clicycle._console_cache.clear()
+        _console_for_width.cache_clear()
         cli1 = Clicycle(width=90)
         console1 = cli1.console
 